@@ -1,6 +1,7 @@
 from typing import AsyncGenerator
 import os
 import json
+import asyncio
 from browser_use.browser.context import BrowserContext
 from .models import (
     oai_compatible_models,
@@ -29,11 +30,29 @@ from .toolcalls import (
 
 logger = logging.getLogger()
 
+# Shared across prompts so the HTTP connection pool to the LLM is reused
+_llm: openai.AsyncClient | None = None
+
+def get_llm_client() -> openai.AsyncClient:
+    global _llm
+
+    if _llm is None:
+        _llm = openai.AsyncClient(
+            base_url=os.getenv("LLM_BASE_URL", "http://localhost:65534/v1"),
+            api_key=os.getenv("LLM_API_KEY", "no-need")
+        )
+
+    return _llm
+
+# Concurrent prompts share messages.json; only one snapshot is written at a time
+_messages_dump_lock = asyncio.Lock()
+
+def _dump_messages(messages: list[dict]) -> None:
+    with open('messages.json', 'w') as f:
+        json.dump(messages, f, indent=2)
+
 async def prompt(messages: list[dict[str, str]], browser_context: BrowserContext, **_) -> AsyncGenerator[str, None]:
-    llm = openai.AsyncClient(
-        base_url=os.getenv("LLM_BASE_URL", "http://localhost:65534/v1"),
-        api_key=os.getenv("LLM_API_KEY", "no-need")
-    )
+    llm = get_llm_client()
 
     response_uuid = random_uuid()
 
@@ -132,8 +151,9 @@ async def prompt(messages: list[dict[str, str]], browser_context: BrowserContext
 
             need_toolcalls = calls < 10 and not has_user_interaction_requested
             
-            with open('messages.json', 'w') as f:
-                json.dump(messages, f, indent=2)
+            # Serialize and write off the event loop so streaming isn't stalled
+            async with _messages_dump_lock:
+                await asyncio.to_thread(_dump_messages, messages)
 
             completion = await llm.chat.completions.create(
                 messages=messages,
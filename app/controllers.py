@@ -5,17 +5,41 @@ from .signals import (
     UnauthorizedAccess,
     RequireUserConfirmation
 )
-from typing import Literal
-from fnmatch import fnmatch
+from typing import Literal, Optional
 import logging
 from playwright._impl._api_structures import (
     ClientCertificate,
     Cookie
 )
 from typing import TypedDict
+from urllib.parse import urlsplit
+import asyncio
+import time
+import weakref
 
 logger = logging.getLogger(__name__)
 
+# A positive authorization result is reused for a short window so that the
+# toolcalls of a single turn don't each probe the page again; negative
+# results are never cached so a fresh login is picked up right away
+AUTHORIZATION_CACHE_TTL = 5.0
+# Past that window a positive result is still trusted for a while as long as
+# the page hasn't left LinkedIn or gone through a sign in/out flow
+AUTHORIZATION_SESSION_TTL = 30.0
+_authorization_cache: "weakref.WeakKeyDictionary[BrowserContext, float]" = weakref.WeakKeyDictionary()
+_authorization_watched_pages: "weakref.WeakSet" = weakref.WeakSet()
+
+# LinkedIn paths that mean the session is changing hands (sign in, sign out,
+# account checks); anything cached about the signed in user is void after them
+SESSION_CHANGE_PATHS = ('/login', '/logout', '/signup', '/checkpoint', '/uas/')
+
+def is_session_change_url(url: str) -> bool:
+    path = urlsplit(url).path
+    return any(part in path for part in SESSION_CHANGE_PATHS)
+
+# (url host, logical name) -> selector that matched last time, tried first next time
+_SELECTOR_CACHE: dict[tuple[str, str], str] = {}
+
 built_in_actions = [
     'done',
     'search_google',
@@ -83,9 +107,55 @@ _controller = Controller(
     exclude_actions=exclude
 )
 
+def invalidate_authorization(ctx: BrowserContext) -> None:
+    _authorization_cache.pop(ctx, None)
+
+def _watch_authorization_navigation(ctx: BrowserContext, page) -> None:
+    if page in _authorization_watched_pages:
+        return
+
+    ctx_ref = weakref.ref(ctx)
+
+    def on_frame_navigated(frame) -> None:
+        if frame.parent_frame is None and is_session_change_url(frame.url):
+            owner = ctx_ref()
+            if owner is not None:
+                invalidate_authorization(owner)
+
+    page.on('framenavigated', on_frame_navigated)
+    _authorization_watched_pages.add(page)
+
 async def check_authorization(ctx: BrowserContext) -> bool:
+    checked_at = _authorization_cache.get(ctx)
+
+    if checked_at is not None:
+        age = time.monotonic() - checked_at
+
+        if age < AUTHORIZATION_CACHE_TTL:
+            return True
+
+        if age < AUTHORIZATION_SESSION_TTL:
+            page = await ctx.get_current_page()
+            if page.url.startswith('https://www.linkedin.com/') and not is_session_change_url(page.url):
+                return True
+
+    is_authorized = await _probe_authorization(ctx)
+
+    if is_authorized:
+        _watch_authorization_navigation(ctx, await ctx.get_current_page())
+        _authorization_cache[ctx] = time.monotonic()
+    else:
+        _authorization_cache.pop(ctx, None)
+
+    return is_authorized
+
+async def _probe_authorization(ctx: BrowserContext) -> bool:
     try:
         page = await ctx.get_current_page()
+
+        # Already on a LinkedIn page with the nav rendered, no need to wait for it
+        if page.url.startswith('https://www.linkedin.com/') and await page.locator('.global-nav').count() > 0:
+            return 'login' not in page.url and 'signup' not in page.url
         
         # First navigate to LinkedIn
         if not page.url.startswith('https://www.linkedin.com'):
@@ -111,6 +181,27 @@ async def check_authorization(ctx: BrowserContext) -> bool:
         logger.error(f"Error checking authorization: {str(e)}")
         return False
 
+async def _read_profile_name(candidates) -> tuple[Optional[str], Optional[str]]:
+    # (selector, element or exception) pairs in priority order -> first
+    # selector that yields a name, and that name
+    for selector, element in candidates:
+        if not element or isinstance(element, Exception):
+            continue
+
+        try:
+            if selector == '.global-nav__me-photo':
+                alt_text = await element.get_attribute('alt')
+                if alt_text:
+                    return selector, alt_text.replace("'s profile photo", "")
+            else:
+                text = await element.text_content()
+                if text:
+                    return selector, text.strip()
+        except Exception:
+            continue
+
+    return None, None
+
 async def get_login_status(ctx: BrowserContext) -> dict:
     """Get detailed LinkedIn login status including profile information if available."""
     page = await ctx.get_current_page()
@@ -137,28 +228,40 @@ async def get_login_status(ctx: BrowserContext) -> dict:
                     '.profile-rail-card__actor-link',
                     '.feed-identity-module__actor-meta'
                 ]
-                
-                for selector in selectors:
-                    try:
-                        element = await page.query_selector(selector)
-                        if element:
-                            if selector == '.global-nav__me-photo':
-                                alt_text = await element.get_attribute('alt')
-                                if alt_text:
-                                    status["profile_name"] = alt_text.replace("'s profile photo", "")
-                                    break
-                            else:
-                                text = await element.text_content()
-                                if text:
-                                    status["profile_name"] = text.strip()
-                                    break
-                    except Exception:
-                        continue
+
+                cache_key = (urlsplit(page.url).netloc, 'profile_name')
+                cached_selector = _SELECTOR_CACHE.get(cache_key)
+
+                # The selector that matched last time is probed first, together
+                # with the profile link; the others are probed concurrently in
+                # the same call if it misses (e.g. feed-only selectors elsewhere)
+                first = [cached_selector] if cached_selector in selectors else selectors
+                rest = [selector for selector in selectors if selector not in first]
+
+                *elements, profile_link = await asyncio.gather(
+                    *(page.query_selector(selector) for selector in first),
+                    page.query_selector('a[data-control-name="identity_profile_photo"]'),
+                    return_exceptions=True
+                )
+                matched_selector, profile_name = await _read_profile_name(zip(first, elements))
+
+                if profile_name is None and rest:
+                    elements = await asyncio.gather(
+                        *(page.query_selector(selector) for selector in rest),
+                        return_exceptions=True
+                    )
+                    matched_selector, profile_name = await _read_profile_name(zip(rest, elements))
+
+                status["profile_name"] = profile_name
+
+                if matched_selector is not None:
+                    _SELECTOR_CACHE[cache_key] = matched_selector
+                else:
+                    _SELECTOR_CACHE.pop(cache_key, None)
                 
                 # Try to get profile URL
                 try:
-                    profile_link = await page.query_selector('a[data-control-name="identity_profile_photo"]')
-                    if profile_link:
+                    if profile_link and not isinstance(profile_link, Exception):
                         href = await profile_link.get_attribute('href')
                         if href:
                             status["profile_url"] = href if href.startswith('http') else f"https://www.linkedin.com{href}"
@@ -175,24 +278,34 @@ async def get_login_status(ctx: BrowserContext) -> dict:
     
     return status
 
-async def ensure_url(ctx: BrowserContext, url: str) -> None:
+async def ensure_url(ctx: BrowserContext, url: str) -> bool:
     page = await ctx.get_current_page()
     current_url = page.url
 
-    if not fnmatch(current_url, url + '*'):
+    # Already there, nothing to match or navigate
+    if current_url.rstrip('/') == url.rstrip('/'):
+        return True
+
+    matched = current_url.startswith(url)
+
+    if not matched:
         logger.info(f'Navigating to {url} from {current_url}')
         await page.goto(url, wait_until='domcontentloaded')
 
-    return fnmatch(current_url, url + '*')
+    return matched
 
 async def sign_out(browser: BrowserContext):
     sites = ['www.linkedin.com', 'linkedin.com']
 
-    for site in sites:
-        await browser.session.context.clear_cookies(domain=site)
+    await asyncio.gather(*(
+        browser.session.context.clear_cookies(domain=site)
+        for site in sites
+    ))
+
+    invalidate_authorization(browser)
         
     page = await browser.get_current_page()
-    await page.reload(wait_until='load')
+    await page.reload(wait_until='domcontentloaded')
 
     return ActionResult(extracted_content='Sign out successful!')
 
@@ -5,234 +5,359 @@ from typing import Optional, Generic, TypeVar, Any
 from .controllers import (
     check_authorization,
     ensure_url,
-    get_login_status
+    get_login_status,
+    invalidate_authorization,
+    is_session_change_url
 )
 from .signals import UnauthorizedAccess
-from pydantic import BaseModel, model_validator
+from dataclasses import dataclass
 import logging
-import json
 import asyncio
-from datetime import datetime
+import re
+import weakref
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
+# user identity read from the nav bar per BrowserContext, with the host it was
+# read on; cleared on sign out and whenever the page leaves LinkedIn or goes
+# through a login/logout flow (e.g. the user switching accounts by hand)
+_identity_cache: "weakref.WeakKeyDictionary[BrowserContext, tuple[str, str]]" = weakref.WeakKeyDictionary()
+_identity_watched_pages: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+def _watch_identity_navigation(ctx: BrowserContext, page: Page) -> None:
+    if page in _identity_watched_pages:
+        return
+
+    ctx_ref = weakref.ref(ctx)
+
+    def on_frame_navigated(frame) -> None:
+        if frame.parent_frame is not None:
+            return
+
+        if urlsplit(frame.url).netloc != 'www.linkedin.com' or is_session_change_url(frame.url):
+            owner = ctx_ref()
+            if owner is not None:
+                _identity_cache.pop(owner, None)
+
+    page.on('framenavigated', on_frame_navigated)
+    _identity_watched_pages.add(page)
+
 _generic_type = TypeVar('_generic_type')
-class ResponseMessage(BaseModel, Generic[_generic_type]):
+
+# Responses are only built internally, so a plain slotted dataclass is
+# enough; there is nothing for pydantic to validate
+@dataclass(slots=True)
+class ResponseMessage(Generic[_generic_type]):
     result: Optional[_generic_type] = None
     error: Optional[str] = None
     success: bool = True
 
-    @model_validator(mode="after")
-    def refine_status(self):
+    def __post_init__(self):
         if self.error is not None:
             self.success = False
-        return self
+
+    @classmethod
+    def ok(cls, result: Optional[_generic_type] = None) -> "ResponseMessage[_generic_type]":
+        return cls(result=result)
+
+    @classmethod
+    def fail(cls, error: str) -> "ResponseMessage[_generic_type]":
+        return cls(error=error)
 
 async def ensure_authorized(ctx: BrowserContext) -> bool:
-    if not await check_authorization(ctx):
-        await ensure_url(ctx, 'https://www.linkedin.com/')
-        raise UnauthorizedAccess('You are not authorized to access this resource. Please log in to your LinkedIn account.')
+    # Both outcomes end on linkedin.com; the auth check itself is usually
+    # served from the authorization cache without touching the page
+    is_authorized = await check_authorization(ctx)
     await ensure_url(ctx, 'https://www.linkedin.com/')
+    if not is_authorized:
+        raise UnauthorizedAccess('You are not authorized to access this resource. Please log in to your LinkedIn account.')
     return True
 
 async def sign_out(ctx: BrowserContext) -> ResponseMessage[bool]:
-    response_model = ResponseMessage[bool]
-    if not await check_authorization(ctx):
-        return response_model(result=True)
-    page = await ctx.get_current_page()
-    await page.goto('https://www.linkedin.com/m/logout')
-    return response_model(result=True)
+    is_authorized, page = await asyncio.gather(
+        check_authorization(ctx),
+        ctx.get_current_page()
+    )
+    if not is_authorized:
+        return ResponseMessage.ok(True)
+    # The logout endpoint just redirects; return once the navigation commits
+    await page.goto('https://www.linkedin.com/m/logout', wait_until='commit', timeout=5000)
+    invalidate_authorization(ctx)
+    _identity_cache.pop(ctx, None)
+    return ResponseMessage.ok(True)
 
 async def check_login_status(ctx: BrowserContext) -> ResponseMessage[dict]:
     """Check the current LinkedIn login status and return profile information if available."""
-    response_model = ResponseMessage[dict]
     try:
         status = await get_login_status(ctx)
-        return response_model(result=status)
+        return ResponseMessage.ok(status)
     except Exception as e:
-        return response_model(error=str(e), success=False)
-
-async def get_context_aware_available_toolcalls(ctx: BrowserContext):
-    toolcalls = [
-        {
-            'type': 'function',
-            'function': {
-                'name': 'sign_out',
-                'description': 'Sign out from the current LinkedIn session.',
-                'parameters': {},
-                'strict': False
-            }
-        },
-        {
-            'type': 'function',
-            'function': {
-                'name': 'check_login_status',
-                'description': 'Check if the user is logged into LinkedIn and get profile information.',
-                'parameters': {},
-                'strict': False
-            }
-        },
-        {
-            'type': 'function',
-            'function': {
-                'name': 'read_full_conversation',
-                'description': 'Reads all messages in the currently open LinkedIn conversation thread.',
-                'parameters': {},
-                'strict': False
-            }
-        },
-        {
-            'type': 'function',
-            'function': {
-                'name': 'fetch_profile_in_message',
-                'description': 'Fetches all profiles from LinkedIn messaging, including conversation metadata and thread links.',
-                'parameters': {},
-                'strict': False
-            }
-        },
-        {
-            'type': 'function',
-            'function': {
-                'name': 'enter_conversation_directly',
-                'description': 'Enters a specific conversation. IMPORTANT: First use fetch_profile_in_message to get the list of conversations, then call this with the exact name.',
-                'parameters': {
-                    'type': 'object',
-                    'properties': {
-                        'target_name': {
-                            'type': 'string',
-                            'description': 'Exact name of the contact to chat with (must match the name from fetch_profile_in_message)'
-                        }
-                    },
-                    'required': ['target_name'],
-                    'additionalProperties': False
+        return ResponseMessage.fail(str(e))
+
+_TOOLCALLS_ALL: tuple[dict, ...] = (
+    {
+        'type': 'function',
+        'function': {
+            'name': 'sign_out',
+            'description': 'Sign out from the current LinkedIn session.',
+            'parameters': {},
+            'strict': False
+        }
+    },
+    {
+        'type': 'function',
+        'function': {
+            'name': 'check_login_status',
+            'description': 'Check if the user is logged into LinkedIn and get profile information.',
+            'parameters': {},
+            'strict': False
+        }
+    },
+    {
+        'type': 'function',
+        'function': {
+            'name': 'read_full_conversation',
+            'description': 'Reads all messages in the currently open LinkedIn conversation thread.',
+            'parameters': {},
+            'strict': False
+        }
+    },
+    {
+        'type': 'function',
+        'function': {
+            'name': 'fetch_profile_in_message',
+            'description': 'Fetches all profiles from LinkedIn messaging, including conversation metadata and thread links.',
+            'parameters': {},
+            'strict': False
+        }
+    },
+    {
+        'type': 'function',
+        'function': {
+            'name': 'enter_conversation_directly',
+            'description': 'Enters a specific conversation. IMPORTANT: First use fetch_profile_in_message to get the list of conversations, then call this with the exact name.',
+            'parameters': {
+                'type': 'object',
+                'properties': {
+                    'target_name': {
+                        'type': 'string',
+                        'description': 'Exact name of the contact to chat with (must match the name from fetch_profile_in_message)'
+                    }
                 },
-                'strict': True
-            }
+                'required': ['target_name'],
+                'additionalProperties': False
+            },
+            'strict': True
         }
-    ]
+    }
+)
 
-    is_authorized = await check_authorization(ctx)
+# All tools except sign_out when authorized
+_TOOLS_AUTHORIZED = tuple(
+    t for t in _TOOLCALLS_ALL
+    if t['function']['name'] != 'sign_out'
+)
 
-    if is_authorized:
-        # Return all tools except sign_out when authorized
-        return [tool for tool in toolcalls if tool['function']['name'] != 'sign_out']
-    else:
-        # Return only sign_out and check_login_status when not authorized
-        allowed_unauthorized = ['sign_out', 'check_login_status']
-        return [tool for tool in toolcalls if tool['function']['name'] in allowed_unauthorized]
+_UNAUTH_ALLOWED = frozenset({'sign_out', 'check_login_status'})
+
+# Only sign_out and check_login_status when not authorized
+_TOOLS_UNAUTHORIZED = tuple(
+    t for t in _TOOLCALLS_ALL
+    if t['function']['name'] in _UNAUTH_ALLOWED
+)
+
+async def get_context_aware_available_toolcalls(ctx: BrowserContext):
+    return _TOOLS_AUTHORIZED if await check_authorization(ctx) else _TOOLS_UNAUTHORIZED
 
 async def execute_toolcall(
     ctx: BrowserContext, 
     tool_name: str, 
     args: dict[str, Any]
 ) -> ResponseMessage[Any]:
-    response_model = ResponseMessage[Any]
-
-    if tool_name == "check_login_status":
-        return await check_login_status(ctx)
-    elif tool_name == "sign_out":
-        return await sign_out(ctx)
-    elif tool_name == "read_full_conversation":
-        return await read_full_conversation(ctx)
-    elif tool_name == "fetch_profile_in_message":
-        return await fetch_profile_in_message(ctx)
-    elif tool_name == "enter_conversation_directly":
-        return await enter_conversation_directly(ctx, args.get("target_name"))
-    else:
-        return response_model(error=f"Unknown tool call: {tool_name}", success=False)
+    handler, required = _DISPATCH.get(tool_name, (None, None))
+
+    if handler is None:
+        return ResponseMessage.fail(f"Unknown tool call: {tool_name}")
+
+    for arg_name in required:
+        if not args.get(arg_name):
+            return ResponseMessage.fail(f"{arg_name} is required")
+
+    return await handler(ctx, *(args[arg_name] for arg_name in required))
 
 async def get_current_user_identity(
     ctx: BrowserContext
 ) -> ResponseMessage[str]:
     """Get the current user's identity from their LinkedIn profile."""
-    response_model = ResponseMessage[str]
+    is_authorized, page = await asyncio.gather(
+        check_authorization(ctx),
+        ctx.get_current_page()
+    )
 
-    if not await check_authorization(ctx):
-        return response_model(error="User is not authorized.", success=False)
+    if not is_authorized:
+        _identity_cache.pop(ctx, None)
+        return ResponseMessage.fail("User is not authorized.")
+
+    host = urlsplit(page.url).netloc
 
-    page = await ctx.get_current_page()
-    url = page.url.strip("/")
+    if host != 'www.linkedin.com':
+        return ResponseMessage.fail("User is not on LinkedIn page.")
 
-    if not url.startswith('https://www.linkedin.com'):
-        return response_model(error="User is not on LinkedIn page.", success=False)
+    # Every page the identity is served for gets its navigations watched
+    _watch_identity_navigation(ctx, page)
+    cached = _identity_cache.get(ctx)
+
+    if cached is not None and cached[0] == host:
+        return ResponseMessage.ok(cached[1])
 
     # Update selector for LinkedIn profile
-    element = await page.query_selector('.global-nav__me-photo')
+    try:
+        user_identity = await page.locator('.global-nav__me-photo').first.get_attribute('alt', timeout=2000)
+    except PlaywrightTimeoutError:
+        return ResponseMessage.fail("Failed to find the user identity element.")
 
-    if not element:
-        return response_model(error="Failed to find the user identity element.", success=False)
+    if user_identity:
+        _identity_cache[ctx] = (host, user_identity)
 
-    user_identity = await element.get_attribute('alt')
-    return response_model(result=user_identity)
+    return ResponseMessage.ok(user_identity)
 
-import re
-from datetime import datetime, timedelta
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# LinkedIn only uses "Mon DD" dividers and "h:mm AM" times, so both are
+# parsed by hand rather than through strptime
+_DATE_RE = re.compile(r'^([A-Za-z]{3})\s+(\d{1,2})$')
+_TIME_RE = re.compile(r'^(\d{1,2}):(\d{2})\s+([AP]M)$', re.IGNORECASE)
+
+@lru_cache(maxsize=512)
+def _parse_divider_date(raw_date: str, year: int) -> Optional[date]:
+    match = _DATE_RE.match(raw_date)
+    if not match:
+        return None
+
+    month = _MONTHS.get(match.group(1).lower())
+    if month is None:
+        return None
+
+    try:
+        return date(year, month, int(match.group(2)))
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=512)
+def _parse_message_datetime(current_date: date, time_str: str) -> Optional[str]:
+    match = _TIME_RE.match(time_str)
+    if not match:
+        return None
+
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if not 1 <= hour <= 12 or minute > 59:
+        return None
+
+    hour %= 12
+    if match.group(3).upper() == 'PM':
+        hour += 12
+
+    return datetime(current_date.year, current_date.month, current_date.day, hour, minute).isoformat()
+
+# Waits for the message list to stop changing (LinkedIn renders long threads
+# lazily), then walks it inside the page and returns, per event, either its
+# date divider text or its bubbles (text, timestamp, whether sent by the other side)
+_JS_READ_CONVERSATION_EVENTS = """
+async () => {
+    const first = document.querySelector('li.msg-s-message-list__event');
+    const root = first && first.parentElement ? first.parentElement : document.body;
+
+    // Resolve once the list saw no mutations for 300ms, or after 3s at most
+    await new Promise(resolve => {
+        const done = () => {
+            observer.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(capTimer);
+            resolve();
+        };
+        const observer = new MutationObserver(() => {
+            clearTimeout(quietTimer);
+            quietTimer = setTimeout(done, 300);
+        });
+        let quietTimer = setTimeout(done, 300);
+        const capTimer = setTimeout(done, 3000);
+        observer.observe(root, { childList: true, subtree: true });
+    });
+
+    return Array.from(document.querySelectorAll('li.msg-s-message-list__event')).map(event => {
+        const dateEl = event.querySelector('span.msg-s-date-divider__date');
+        if (dateEl) {
+            return { date: dateEl.innerText.trim(), bubbles: [] };
+        }
+
+        const bubbles = Array.from(event.querySelectorAll('div.msg-s-event-listitem__message-bubble')).map(bubble => {
+            const textEl = bubble.querySelector('p');
+            const timestampEl = bubble.querySelector('span.msg-s-message-group__timestamp');
+            const parent = bubble.parentElement;
+
+            return {
+                text: textEl ? textEl.innerText.trim() : '',
+                time: timestampEl ? timestampEl.innerText.trim() : null,
+                other: parent ? parent.className.includes('msg-s-event-listitem--other') : false
+            };
+        });
+
+        return { date: null, bubbles: bubbles };
+    });
+}
+"""
 
 async def read_full_conversation(ctx: BrowserContext) -> ResponseMessage[list[dict]]:
     """
     Reads all messages in the currently open LinkedIn conversation thread,
     capturing sender, message text, and specific datetime (from date separators + per-message time).
     """
-    response_model = ResponseMessage[list[dict]]
-
     if not await check_authorization(ctx):
-        return response_model(error="User is not authorized.", success=False)
+        return ResponseMessage.fail("User is not authorized.")
 
     try:
         page = await ctx.get_current_page()
-        await page.wait_for_selector("li.msg-s-message-list__event", timeout=15_000)
+        await page.wait_for_selector("li.msg-s-message-list__event", state="attached", timeout=15_000)
 
-        # All message blocks (date dividers + bubbles)
-        events = await page.query_selector_all("li.msg-s-message-list__event")
+        # All message blocks (date dividers + bubbles), read in a single round-trip
+        events = await page.evaluate(_JS_READ_CONVERSATION_EVENTS)
 
         results = []
         current_date = None
         last_time = None
+        today = datetime.now().date()
 
         for event in events:
             # Check if this is a date divider
-            date_el = await event.query_selector("span.msg-s-date-divider__date")
-            if date_el:
-                raw_date = (await date_el.inner_text()).strip()
+            if event["date"] is not None:
+                raw_date = event["date"].lower()
 
                 # Parse date string
-                today = datetime.now()
-                if raw_date.lower() == "today":
-                    current_date = today.date()
-                elif raw_date.lower() == "yesterday":
-                    current_date = (today - timedelta(days=1)).date()
+                if raw_date == "today":
+                    current_date = today
+                elif raw_date == "yesterday":
+                    current_date = today - timedelta(days=1)
                 else:
-                    try:
-                        current_date = datetime.strptime(raw_date, "%b %d").replace(year=today.year).date()
-                    except ValueError:
-                        current_date = None
+                    current_date = _parse_divider_date(event["date"], today.year)
                 continue
 
-            # Find all message bubbles in this block
-            bubbles = await event.query_selector_all("div.msg-s-event-listitem__message-bubble")
-            for bubble in bubbles:
-                # Message text
-                text_el = await bubble.query_selector("p")
-                text = (await text_el.inner_text()).strip() if text_el else ""
-
-                # Sender
-                parent = await bubble.evaluate_handle("node => node.parentElement")
-                class_list = await parent.evaluate("node => node.className")
-                sender = "them" if "msg-s-event-listitem--other" in class_list else "me"
+            for bubble in event["bubbles"]:
+                text = bubble["text"]
+                sender = "them" if bubble["other"] else "me"
 
                 # Time (if any)
-                timestamp_el = await bubble.query_selector("span.msg-s-message-group__timestamp")
-                time_str = (await timestamp_el.inner_text()).strip() if timestamp_el else None
-                if time_str:
-                    last_time = time_str
+                if bubble["time"]:
+                    last_time = bubble["time"]
 
                 # Combine current_date + last_time
                 if current_date and last_time:
-                    try:
-                        full_datetime = datetime.strptime(f"{current_date} {last_time}", "%Y-%m-%d %I:%M %p")
-                        datetime_str = full_datetime.isoformat()
-                    except Exception:
-                        datetime_str = None
+                    datetime_str = _parse_message_datetime(current_date, last_time)
                 else:
                     datetime_str = None
 
@@ -243,13 +368,94 @@ async def read_full_conversation(ctx: BrowserContext) -> ResponseMessage[list[di
                         "datetime": datetime_str
                     })
 
-        return response_model(result=results)
+        return ResponseMessage.ok(results)
 
     except PlaywrightTimeoutError:
-        return response_model(error="Timeout waiting for messages to load", success=False)
+        return ResponseMessage.fail("Timeout waiting for messages to load")
     except Exception as e:
-        logger.error(f"Error reading conversation: {str(e)}")
-        return response_model(error=f"Failed to read conversation: {str(e)}", success=False)
+        logger.error("Error reading conversation: %s", e)
+        return ResponseMessage.fail(f"Failed to read conversation: {str(e)}")
+
+# Reads name, last message time and preview of the given conversation cards
+_JS_READ_CONVERSATION_CARDS = """
+cards => cards.map(card => {
+    const read = selector => {
+        const el = card.querySelector(selector);
+        return el ? el.textContent.trim() : null;
+    };
+
+    return {
+        name: read('.msg-conversation-card__participant-names'),
+        last_message_time: read('.msg-conversation-card__time-stamp'),
+        preview: read('.msg-conversation-card__message-snippet')
+    };
+})
+"""
+
+# Index of the conversation card whose participant name matches exactly, or -1
+_JS_FIND_CONVERSATION_INDEX = """
+name => Array.from(document.querySelectorAll('.msg-conversation-card')).findIndex(card => {
+    const el = card.querySelector('.msg-conversation-card__participant-names');
+    return el !== null && el.textContent.trim() === name;
+})
+"""
+
+# Conversation card selectors, the current one first and older layouts after it
+_CONVERSATION_CARD_SELECTORS = [
+    '.msg-conversation-card',
+    'li.msg-conversation-listitem',
+    '.msg-conversation-listitem__link',
+    '.msg-selectable-entity'
+]
+
+# Picks the first card selector with matches and reads the match count, the
+# participant name of the card at the given index and whether that card's
+# thread is the one already open
+_JS_READ_CONVERSATION_CARD_AT = """
+([selectors, index]) => {
+    const threadLink = 'a[href*="/messaging/thread/"]';
+    const trimSlash = path => path.replace(/\\/+$/, '');
+
+    for (const selector of selectors) {
+        const cards = document.querySelectorAll(selector);
+        if (cards.length === 0) {
+            continue;
+        }
+
+        const card = cards[index];
+        const nameEl = card ? card.querySelector('.msg-conversation-card__participant-names') : null;
+        const link = card
+            ? (card.matches(threadLink) ? card : card.querySelector(threadLink) || card.closest(threadLink))
+            : null;
+
+        return {
+            selector: selector,
+            count: cards.length,
+            name: nameEl ? nameEl.textContent.trim() : null,
+            is_open: link !== null && trimSlash(new URL(link.href).pathname) === trimSlash(location.pathname)
+        };
+    }
+
+    return { selector: null, count: 0, name: null, is_open: false };
+}
+"""
+
+async def _open_conversation_list(page: Page) -> None:
+    # Check if we're already on the messaging page
+    if not page.url.startswith('https://www.linkedin.com/messaging'):
+        logger.info("Navigating to messaging page...")
+        await page.goto('https://www.linkedin.com/messaging/')
+
+    # Wait for the messaging overlay
+    messaging_container = page.locator('div.msg-overlay-list-bubble')
+    await messaging_container.wait_for(state="visible", timeout=10000)
+
+    # Wait for the conversation list
+    conversation_list = page.locator('.msg-conversations-container__conversations-list')
+    await conversation_list.wait_for(state="visible", timeout=10000)
+
+async def _find_conversation_index_by_name(page: Page, target_name: str) -> int:
+    return await page.evaluate(_JS_FIND_CONVERSATION_INDEX, target_name.strip())
 
 async def fetch_profile_in_message(ctx: BrowserContext) -> ResponseMessage[dict]:
     """
@@ -269,10 +475,8 @@ async def fetch_profile_in_message(ctx: BrowserContext) -> ResponseMessage[dict]
     Use this function first to get a list of conversations, then use enter_conversation_directly
     with the chosen conversation data.
     """
-    response_model = ResponseMessage[dict]
-    
     if not await check_authorization(ctx):
-        return response_model(error="User is not authorized.", success=False)
+        return ResponseMessage.fail("User is not authorized.")
     
     try:
         page = await ctx.get_current_page()
@@ -286,72 +490,28 @@ async def fetch_profile_in_message(ctx: BrowserContext) -> ResponseMessage[dict]
             }
         }
         
-        # Check if we're already on the messaging page
-        current_url = page.url
-        if not current_url.startswith('https://www.linkedin.com/messaging'):
-            logger.info("Navigating to messaging page...")
-            await page.goto('https://www.linkedin.com/messaging/')
-        
-        # Wait for the messaging overlay
-        messaging_container = page.locator('div.msg-overlay-list-bubble')
-        await messaging_container.wait_for(state="visible", timeout=10000)
+        await _open_conversation_list(page)
         
-        # Wait for the conversation list
-        conversation_list = page.locator('.msg-conversations-container__conversations-list')
-        await conversation_list.wait_for(state="visible", timeout=10000)
+        # Get all conversation threads with their preview info in a single round-trip
+        cards = await page.locator('.msg-conversation-card').evaluate_all(_JS_READ_CONVERSATION_CARDS)
         
-        # Get all conversation threads
-        thread_elements = page.locator('.msg-conversation-card')
-        thread_count = await thread_elements.count()
+        result["metadata"]["total_count"] = len(cards)
+        logger.info("Found %s conversations", len(cards))
         
-        result["metadata"]["total_count"] = thread_count
-        logger.info(f"Found {thread_count} conversations")
-        
-        # Gather basic message preview information
-        for i in range(thread_count):
-            try:
-                thread = thread_elements.nth(i)
-                
-                # Get name
-                name_element = thread.locator('.msg-conversation-card__participant-names')
-                name = await name_element.text_content()
-                name = name.strip()
-                
-                # Get last message time
-                try:
-                    time_element = thread.locator('.msg-conversation-card__time-stamp')
-                    last_message_time = await time_element.text_content()
-                    last_message_time = last_message_time.strip()
-                except:
-                    last_message_time = None
-                
-                # Try to get message preview text
-                try:
-                    preview_element = thread.locator('.msg-conversation-card__message-snippet')
-                    preview_text = await preview_element.text_content()
-                    preview_text = preview_text.strip()
-                except:
-                    preview_text = None
-                
-                # Store only the essential preview info
-                message_data = {
-                    "name": name,
-                    "last_message_time": last_message_time,
-                    "preview": preview_text
-                }
-                
-                result["messages"].append(message_data)
-                logger.info(f"Gathered message preview for: {name}")
-                
-            except Exception as e:
-                logger.error(f"Error gathering message preview: {str(e)}")
+        for card in cards:
+            if card["name"] is None:
+                logger.error("Error gathering message preview: conversation card has no participant name")
                 continue
+
+            # Store only the essential preview info
+            result["messages"].append(card)
+            logger.debug("Gathered message preview for: %s", card["name"])
         
-        return response_model(result=result)
+        return ResponseMessage.ok(result)
         
     except Exception as e:
-        logger.error(f"Error in fetch_profile_in_message: {str(e)}")
-        return response_model(error=str(e), success=False)
+        logger.error("Error in fetch_profile_in_message: %s", e)
+        return ResponseMessage.fail(str(e))
 
 async def enter_conversation_directly(ctx: BrowserContext, target_name: str) -> ResponseMessage[bool]:
     """
@@ -369,96 +529,80 @@ async def enter_conversation_directly(ctx: BrowserContext, target_name: str) ->
     Returns:
         ResponseMessage[bool]: Success/failure status with error message if failed
     """
-    response_model = ResponseMessage[bool]
-    
-    if not await check_authorization(ctx):
-        return response_model(error="User is not authorized.", success=False)
+    is_authorized, page = await asyncio.gather(
+        check_authorization(ctx),
+        ctx.get_current_page()
+    )
+
+    if not is_authorized:
+        return ResponseMessage.fail("User is not authorized.")
     
     try:
-        # First get the list of conversations
-        conversations_result = await fetch_profile_in_message(ctx)
-        if not conversations_result.success:
-            return response_model(error=f"Failed to fetch conversations: {conversations_result.error}", success=False)
-        
-        # Find the matching conversation
-        target_conversation = None
-        target_index = -1
-        
-        for idx, msg in enumerate(conversations_result.result["messages"]):
-            if msg["name"].strip() == target_name.strip():
-                target_conversation = msg
-                target_index = idx
-                break
+        # Open the messaging overlay and find the matching conversation,
+        # reading only the participant names
+        await _open_conversation_list(page)
+        target_index = await _find_conversation_index_by_name(page, target_name)
         
-        if target_conversation is None:
-            return response_model(
-                error=f"Could not find conversation with contact: {target_name}. Please verify the exact name from the conversation list.", 
-                success=False
+        if target_index < 0:
+            return ResponseMessage.fail(
+                f"Could not find conversation with contact: {target_name}. Please verify the exact name from the conversation list."
             )
         
-        page = await ctx.get_current_page()
-        
         try:
-            # Ensure we're on messaging page
-            messaging_container = page.locator('div.msg-overlay-list-bubble')
-            if not await messaging_container.is_visible():
-                logger.info("Opening messaging overlay...")
-                await page.goto('https://www.linkedin.com/messaging/')
-                await messaging_container.wait_for(state="visible", timeout=10000)
+            logger.info("Attempting to enter conversation with: %s", target_name)
             
-            logger.info(f"Attempting to enter conversation with: {target_name}")
-            
-            # Locate the conversation card
-            conversation_cards = page.locator('.msg-conversation-card')
-            count = await conversation_cards.count()
+            # Read everything needed about the card in one go before clicking it
+            card_state = await page.evaluate(
+                _JS_READ_CONVERSATION_CARD_AT,
+                [_CONVERSATION_CARD_SELECTORS, target_index]
+            )
+            count = card_state["count"]
             
-            if count == 0:
-                logger.info("No conversations visible, checking alternative selectors...")
-                alternative_selectors = [
-                    'li.msg-conversation-listitem',
-                    '.msg-conversation-listitem__link',
-                    '.msg-selectable-entity'
-                ]
-                
-                for selector in alternative_selectors:
-                    conversation_cards = page.locator(selector)
-                    count = await conversation_cards.count()
-                    if count > 0:
-                        logger.info(f"Found conversations using: {selector}")
-                        break
+            if card_state["selector"] not in (None, _CONVERSATION_CARD_SELECTORS[0]):
+                logger.info("Found conversations using: %s", card_state["selector"])
             
             if target_index >= count:
-                return response_model(
-                    error=f"Conversation index {target_index} out of range (total: {count})", 
-                    success=False
+                return ResponseMessage.fail(
+                    f"Conversation index {target_index} out of range (total: {count})"
                 )
                 
             # Get the specific conversation card
-            card = conversation_cards.nth(target_index)
+            card = page.locator(card_state["selector"]).nth(target_index)
             
             # Verify we're clicking the right conversation
-            name_element = card.locator('.msg-conversation-card__participant-names')
-            if await name_element.count() > 0:
-                actual_name = await name_element.text_content()
-                actual_name = actual_name.strip()
-                if actual_name != target_name:
-                    return response_model(
-                        error=f"Name mismatch: Expected '{target_name}', found '{actual_name}'",
-                        success=False
-                    )
+            actual_name = card_state["name"]
+            if actual_name is not None and actual_name != target_name:
+                return ResponseMessage.fail(
+                    f"Name mismatch: Expected '{target_name}', found '{actual_name}'"
+                )
             
             # Click the conversation
             logger.info("Entering conversation...")
-            await card.click()
-            await page.wait_for_url("**/messaging/thread/**", timeout=5000)
+            if card_state["is_open"]:
+                # /messaging/ redirects to the latest thread; clicking the thread
+                # that is already open changes no URL, so there is nothing to wait for
+                await card.click(timeout=5000)
+            else:
+                # Register the navigation waiter before clicking so the URL change can't be missed
+                async with page.expect_navigation(url="**/messaging/thread/**", timeout=5000):
+                    await card.click(timeout=5000)
             
-            logger.info(f"Successfully entered conversation with {target_name}")
-            return response_model(result=True)
+            logger.info("Successfully entered conversation with %s", target_name)
+            return ResponseMessage.ok(True)
             
         except Exception as e:
-            logger.error(f"Failed to enter conversation: {str(e)}")
-            return response_model(error=str(e), success=False)
+            logger.error("Failed to enter conversation: %s", e)
+            return ResponseMessage.fail(str(e))
             
     except Exception as e:
-        logger.error(f"Error in enter_conversation_directly: {str(e)}")
-        return response_model(error=str(e), success=False)
+        logger.error("Error in enter_conversation_directly: %s", e)
+        return ResponseMessage.fail(str(e))
+
+# tool name -> (handler, names of the arguments passed to it in order)
+_DISPATCH = {
+    "check_login_status": (check_login_status, ()),
+    "sign_out": (sign_out, ()),
+    "read_full_conversation": (read_full_conversation, ()),
+    "fetch_profile_in_message": (fetch_profile_in_message, ()),
+    "enter_conversation_directly": (enter_conversation_directly, ("target_name",)),
+}
@@ -40,7 +40,7 @@ def get_system_prompt() -> str:
 def repair_json_no_except(json_str: str) -> str:
     try:
         return repair_json(json_str)
-    except:
+    except Exception:
         logger.info(f"failed to repair json string {json_str}")
         return json_str
 
@@ -65,8 +65,10 @@ def preserve_upload_file(file_data_uri: str, file_name: str) -> str:
         return None
 
 import re
+_TOOLCALL_NOTI_RE = re.compile(r"<details\b[^>]*>.*?</details>", flags=re.DOTALL | re.IGNORECASE)
+
 def strip_toolcall_noti(content: str) -> str:
-    cleaned = re.sub(r"<details\b[^>]*>.*?</details>", "", content, flags=re.DOTALL | re.IGNORECASE)
+    cleaned = _TOOLCALL_NOTI_RE.sub("", content)
     return cleaned.strip()
  
 
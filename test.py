@@ -1,7 +1,79 @@
 from argparse import ArgumentParser
-import requests
-import json
+import atexit
+import orjson
 import re
+import sys
+import time
+
+# Lines that start with a "thinking out loud" phrase, stripped from the
+# assistant message before it is kept in the history
+THINKING_PATTERN = re.compile(
+    r"^(?:"
+    r"(?:Okay|Ok|Alright|Sure|Let me|I'll|I will|First|Now|Hmm)[,\s]"
+    r"|I (?:see|understand|notice|observe|think|believe)"
+    r"|Based on"
+    r"|Looking at"
+    r"|Checking"
+    r"|Searching"
+    r"|Let's"
+    r").*?\n",
+    flags=re.IGNORECASE | re.MULTILINE
+)
+
+SSE_DATA_PREFIX = b"data: "
+
+class StreamPrinter:
+    # Coalesces streamed deltas into one stdout write every 64 chars or 20ms;
+    # whatever is left is flushed before the stream blocks on the next read
+    def __init__(self, max_chars: int = 64, max_delay: float = 0.02):
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self.pending = []
+        self.pending_chars = 0
+        self.last_flush = time.monotonic()
+
+    def write(self, text: str):
+        self.pending.append(text)
+        self.pending_chars += len(text)
+
+        if self.pending_chars >= self.max_chars or time.monotonic() - self.last_flush >= self.max_delay:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            sys.stdout.write(''.join(self.pending))
+            sys.stdout.flush()
+            self.pending.clear()
+            self.pending_chars = 0
+
+        self.last_flush = time.monotonic()
+
+def append_chat_history(fp, message: dict):
+    fp.write(orjson.dumps(message) + b"\n")
+    fp.flush()
+
+def iter_sse_lines(response: "httpx.Response", on_idle=None):
+    # Splits every network read into lines in one pass as soon as it arrives,
+    # so frames that arrive coalesced are handled without extra reads; only
+    # the trailing partial line is carried over to the next read. No
+    # chunk_size is passed: httpx would hold data back until that many bytes
+    # have built up
+    buffer = b""
+
+    for data in response.iter_bytes():
+        lines = (buffer + data).split(b"\n")
+        buffer = lines.pop()
+
+        for line in lines:
+            yield line.rstrip(b"\r")
+
+        # Everything received so far was handed out; the next read may block
+        # for a while (e.g. while a tool call runs)
+        if on_idle is not None:
+            on_idle()
+
+    if buffer:
+        yield buffer
 
 if __name__ == "__main__":
     parser = ArgumentParser()
@@ -15,16 +87,23 @@ if __name__ == "__main__":
         # 'shoot it'
     ]
 
-    user_messages_it = iter(user_messages)
+    # Scripted messages sent before falling back to input(); callables are
+    # still resolved lazily, right before their turn
+    prelude = (m() if callable(m) else m for m in user_messages)
     messages = []
+
+    # Every message is appended to the JSONL log as it happens
+    history_log = open("chat_history.jsonl", "ab")
+    atexit.register(history_log.close)
     
     address = args.address
+
+    # Created on the first message so that quitting right away doesn't pay
+    # for importing httpx
+    session = None
     
     while True:
-        message = next(user_messages_it, None)
-        
-        if callable(message):
-            message = message()
+        message = next(prelude, None)
 
         if message is None:
             message = input("\n\nType your message (or 'exit' to quit): ")
@@ -36,33 +115,41 @@ if __name__ == "__main__":
         print("User: ", message, end="", flush=True)
 
         messages.append({"role": "user", "content": message})
-        response = requests.post(
-            address, 
-            json={"messages": messages},
+        append_chat_history(history_log, messages[-1])
+
+        if session is None:
+            import httpx
+
+            # Keeps the connection to the server alive across turns; HTTP/2 is
+            # negotiated when the server supports it over TLS
+            session = httpx.Client(http2=True, timeout=None)
+
+        response = session.send(
+            session.build_request("POST", address, json={"messages": messages}),
             stream=True
         )
 
-        with open("chat_history.json", "w") as f:
-            json.dump(messages, f, indent=2)
-
         print("\n" * 2)
         print("Assistant: ", end="", flush=True)
         
         assistant_message = ''
+        printer = StreamPrinter()
 
-        for chunk in response.iter_lines():
-            if chunk and chunk.startswith(b"data: "):
-                chunk = chunk[6:]
+        for chunk in iter_sse_lines(response, on_idle=printer.flush):
+            if chunk.startswith(SSE_DATA_PREFIX):
+                # orjson parses the memoryview directly, so stripping the prefix
+                # doesn't copy the frame once more
+                chunk = memoryview(chunk)[len(SSE_DATA_PREFIX):]
         
                 if chunk == b"[DONE]":
                     break
         
                 try:
-                    decoded_chunk = chunk.decode("utf-8")
-                    json_chunk = json.loads(decoded_chunk)
+                    json_chunk = orjson.loads(chunk)
                     
                     # Handle error responses
                     if "error" in json_chunk:
+                        printer.flush()
                         print(f"\nError: {json_chunk['error']}")
                         break
                         
@@ -73,37 +160,32 @@ if __name__ == "__main__":
                         role = delta.get("role")
                         
                         if content:
-                            print(content, end="", flush=True)
+                            printer.write(content)
                             if role in [None, "assistant"]:
                                 assistant_message += content
                     elif "message" in json_chunk:
+                        printer.flush()
                         print(f"\nMessage: {json_chunk['message']}")
                         
-                except json.JSONDecodeError:
-                    print(f"\nError decoding response: {decoded_chunk}")
+                except orjson.JSONDecodeError:
+                    printer.flush()
+                    print(f"\nError decoding response: {bytes(chunk).decode('utf-8', errors='replace')}")
                 except Exception as e:
+                    printer.flush()
                     print(f"\nError processing response: {str(e)}")
                     continue
 
+        printer.flush()
+        response.close()
+
         # Filter out the thinking part if present
         if assistant_message:
             # Remove any text that starts with "Okay, let me" or similar thinking phrases
-            thinking_patterns = [
-                r"^(Okay|Ok|Alright|Sure|Let me|I'll|I will|First|Now|Hmm)[,\s].*?\n",
-                r"^I (see|understand|notice|observe|think|believe).*?\n",
-                r"^Based on.*?\n",
-                r"^Looking at.*?\n",
-                r"^Checking.*?\n",
-                r"^Searching.*?\n",
-                r"^Let's.*?\n"
-            ]
-            
-            filtered_message = assistant_message
-            for pattern in thinking_patterns:
-                filtered_message = re.sub(pattern, '', filtered_message, flags=re.IGNORECASE | re.MULTILINE)
+            filtered_message = THINKING_PATTERN.sub('', assistant_message)
             
             # Only append if there's content after filtering
             if filtered_message.strip():
                 messages.append({"role": "assistant", "content": filtered_message.strip()})
+                append_chat_history(history_log, messages[-1])
 
         print("\n" * 2)